@@ -10,13 +10,22 @@ Drop-in replacement for:
 evennia/contrib/tutorials/tutorial_world/intro_menu.py
 """
 
-from evennia import CmdSet, create_object
-from evennia.utils.evmenu import EvMenu, parse_menu_template
+import sys
+from dataclasses import dataclass, fields
+
+from django.db.transaction import atomic
+
+from evennia import CmdSet, create_object, default_cmds
+from evennia.utils import dbserialize
+from evennia.utils.evmenu import EvMenu, bind_menu_template, parse_menu_template_contents
 
 # ============================================================
 # Helper callbacks
 # ============================================================
 
+# send-options for messages to the webclient 'testing' pane
+_TESTING_TAG = {"type": "testing"}
+
 
 def do_nothing(caller, raw_string, **kwargs):
     """Re-runs the current node (used for idle clicks)."""
@@ -27,11 +36,8 @@ def send_testing_tagged(caller, raw_string, **kwargs):
     """Sends a tagged packet to the 'testing' webclient pane."""
     caller.msg(
         (
-            (
-                f"Transmitting packet to |ctag:'testing'|n.\n"
-                f"Payload contents: '{raw_string}'"
-            ),
-            {"type": "testing"},
+            f"Transmitting packet to |ctag:'testing'|n.\nPayload contents: '{raw_string}'",
+            _TESTING_TAG,
         )
     )
     return None
@@ -42,51 +48,49 @@ def send_testing_tagged(caller, raw_string, **kwargs):
 # ============================================================
 
 
-class DemoCommandSetHelp(CmdSet):
-    """Demo the help interface."""
+class _DemoCommandSet(CmdSet):
+    """Base for the demo sets; adds all classes in `cmds` in one go."""
 
-    key = "Help Demo Set"
-    priority = 2
+    cmds = ()
 
     def at_cmdset_creation(self):
-        from evennia import default_cmds
+        self.add(self.cmds)
 
-        self.add(default_cmds.CmdHelp())
-        self.add(default_cmds.CmdChannel())
+
+class DemoCommandSetHelp(_DemoCommandSet):
+    """Demo the help interface."""
+
+    key = "Help Demo Set"
+    priority = 2
+    cmds = (default_cmds.CmdHelp, default_cmds.CmdChannel)
 
 
 def goto_command_demo_help(caller, raw_string, **kwargs):
     """Prep and go to help demo."""
     _maintain_demo_room(caller, delete=True)
-    caller.cmdset.remove(DemoCommandSetRoom)
-    caller.cmdset.remove(DemoCommandSetComms)
-    caller.cmdset.add(DemoCommandSetHelp)
+    _swap_demo_cmdset(caller, DemoCommandSetHelp)
     return kwargs.get("gotonode") or "command_demo_help"
 
 
-class DemoCommandSetComms(CmdSet):
+class DemoCommandSetComms(_DemoCommandSet):
     """Demo comms / color."""
 
     key = "Comms Demo Set"
     priority = 2
     no_exits = True
     no_objs = True
-
-    def at_cmdset_creation(self):
-        from evennia import default_cmds
-
-        self.add(default_cmds.CmdHelp())
-        self.add(default_cmds.CmdSay())
-        self.add(default_cmds.CmdPose())
-        self.add(default_cmds.CmdPage())
-        self.add(default_cmds.CmdColorTest())
+    cmds = (
+        default_cmds.CmdHelp,
+        default_cmds.CmdSay,
+        default_cmds.CmdPose,
+        default_cmds.CmdPage,
+        default_cmds.CmdColorTest,
+    )
 
 
 def goto_command_demo_comms(caller, raw_string, **kwargs):
     """Setup and go to color demo node."""
-    caller.cmdset.remove(DemoCommandSetHelp)
-    caller.cmdset.remove(DemoCommandSetRoom)
-    caller.cmdset.add(DemoCommandSetComms)
+    _swap_demo_cmdset(caller, DemoCommandSetComms)
     return kwargs.get("gotonode") or "comms_demo_start"
 
 
@@ -98,7 +102,7 @@ _ROOM_DESC = """
 You materialize inside a small |ytraining pod|n. Holo-lights pulse through the
 plating, projecting a simulation of a tight neon alleyway. Energy hums in the air.
 Try |wlook sign|n to scan the neon notice by the console.
-"""
+""".lstrip()
 
 _SIGN_DESC = """
 The flickering sign reads:
@@ -111,20 +115,20 @@ The flickering sign reads:
     Even text shortcuts work here. Experiment with partial identifiers!
 
     When done, |wlook door|n to continue.
-"""
+""".strip()
 
 _DOOR_DESC_OUT = """
 A reinforced bulkhead door, rimmed with holo-locks. A glowing line reads:
 
     |wEXIT|n — neural gate to the outer simulation.
     Type '|wdoor|n' to breach the boundary field.
-"""
+""".strip()
 
 _DOOR_DESC_IN = """
 The bulkhead door leading back into the training pod. Carved code reads:
 
     Access: '|wdoor|n' or '|win|n' to re-enter calibration space.
-"""
+""".strip()
 
 _MEADOW_DESC = """
 The world flickers — your environment shifts to a wide digital boulevard
@@ -132,7 +136,7 @@ bathed in neon rain. Holographic billboards scroll data endlessly.
 A faint hum from overhead drones fills the void.
 
 Try |wlook datapad|n.
-"""
+""".lstrip()
 
 _STONE_DESC = """
 A cracked |mdatapad|n lies on the asphalt, its screen looping an old tutorial:
@@ -142,7 +146,38 @@ A cracked |mdatapad|n lies on the asphalt, its screen looping an old tutorial:
     |wdrop datapad|n discards it.
 
 Type |wnext|n when you’re ready to proceed.
-"""
+""".strip()
+
+
+@dataclass(slots=True)
+class _DemoRoomState:
+    """
+    The temporary objects making up one caller's holo-training environment.
+    The db-objects are (de)serialized explicitly so this can be stored in
+    an Attribute.
+    """
+
+    prev_loc: object
+    pod: object
+    sign: object
+    street: object
+    pad: object
+    door_out: object
+    door_in: object
+
+    def __serialize_dbobjs__(self):
+        for field in fields(self):
+            setattr(self, field.name, dbserialize.dbserialize(getattr(self, field.name)))
+
+    def __deserialize_dbobjs__(self):
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, bytes):
+                setattr(self, field.name, dbserialize.dbunserialize(value))
+
+    def created_objects(self):
+        """The objects to delete, in deletion order."""
+        return (self.sign, self.pad, self.door_out, self.door_in, self.pod, self.street)
 
 
 def _maintain_demo_room(caller, delete=False):
@@ -152,96 +187,120 @@ def _maintain_demo_room(caller, delete=False):
     roomdata = caller.db.neoeden_demo_room_data
     if delete:
         if roomdata:
-            prev_loc, pod, sign, street, pad, door_out, door_in = roomdata
-            caller.location = prev_loc
-            sign.delete()
-            pad.delete()
-            door_out.delete()
-            door_in.delete()
-            pod.delete()
-            street.delete()
+            if isinstance(roomdata, tuple):
+                # stored by an older version of this module
+                roomdata = _DemoRoomState(*roomdata)
+            caller.location = roomdata.prev_loc
+            # obj.delete() runs the typeclass cleanup (hooks, exits, caches) that
+            # a queryset bulk-delete would skip, so just group them in one transaction
+            with atomic():
+                for obj in roomdata.created_objects():
+                    obj.delete()
             del caller.db.neoeden_demo_room_data
     elif not roomdata:
-        pod = create_object("evennia.objects.objects.DefaultRoom", key="Training Pod-01")
-        pod.db.desc = _ROOM_DESC.lstrip()
-        sign = create_object(
-            "evennia.objects.objects.DefaultObject",
-            key="flickering neon sign",
-            location=pod,
-        )
-        sign.db.desc = _SIGN_DESC.strip()
-        sign.locks.add("get:false()")
-        sign.db.get_err_msg = "The sign is bolted to the console."
-
-        street = create_object("evennia.objects.objects.DefaultRoom", key="Neon Alleyway")
-        street.db.desc = _MEADOW_DESC.lstrip()
-        pad = create_object(
-            "evennia.objects.objects.DefaultObject", key="cracked datapad", location=street
-        )
-        pad.db.desc = _STONE_DESC.strip()
-
-        door_out = create_object(
-            "evennia.objects.objects.DefaultExit",
-            key="Door",
-            location=pod,
-            destination=street,
-            locks=["get:false()"],
-        )
-        door_out.db.desc = _DOOR_DESC_OUT.strip()
-        door_in = create_object(
-            "evennia.objects.objects.DefaultExit",
-            key="holo-door entrance",
-            aliases=["door", "in", "entrance"],
-            location=street,
-            destination=pod,
-            locks=["get:false()"],
-        )
-        door_in.db.desc = _DOOR_DESC_IN.strip()
-
-        caller.db.neoeden_demo_room_data = (
-            caller.location,
-            pod,
-            sign,
-            street,
-            pad,
-            door_out,
-            door_in,
+        # set desc/locks at creation and group all writes in one transaction
+        with atomic():
+            pod = create_object(
+                "evennia.objects.objects.DefaultRoom",
+                key="Training Pod-01",
+                attributes=[("desc", _ROOM_DESC)],
+            )
+            sign = create_object(
+                "evennia.objects.objects.DefaultObject",
+                key="flickering neon sign",
+                location=pod,
+                locks="get:false()",
+                attributes=[
+                    ("desc", _SIGN_DESC),
+                    ("get_err_msg", "The sign is bolted to the console."),
+                ],
+            )
+
+            street = create_object(
+                "evennia.objects.objects.DefaultRoom",
+                key="Neon Alleyway",
+                attributes=[("desc", _MEADOW_DESC)],
+            )
+            pad = create_object(
+                "evennia.objects.objects.DefaultObject",
+                key="cracked datapad",
+                location=street,
+                attributes=[("desc", _STONE_DESC)],
+            )
+
+            door_out = create_object(
+                "evennia.objects.objects.DefaultExit",
+                key="Door",
+                location=pod,
+                destination=street,
+                locks=["get:false()"],
+                attributes=[("desc", _DOOR_DESC_OUT)],
+            )
+            door_in = create_object(
+                "evennia.objects.objects.DefaultExit",
+                key="holo-door entrance",
+                aliases=["door", "in", "entrance"],
+                location=street,
+                destination=pod,
+                locks=["get:false()"],
+                attributes=[("desc", _DOOR_DESC_IN)],
+            )
+
+        caller.db.neoeden_demo_room_data = _DemoRoomState(
+            prev_loc=caller.location,
+            pod=pod,
+            sign=sign,
+            street=street,
+            pad=pad,
+            door_out=door_out,
+            door_in=door_in,
         )
         caller.location = pod
 
 
-class DemoCommandSetRoom(CmdSet):
+class DemoCommandSetRoom(_DemoCommandSet):
     """Demo exploration commands."""
 
     key = "Room Demo Set"
     priority = 2
     no_exits = False
     no_objs = False
+    cmds = (
+        default_cmds.CmdHelp,
+        default_cmds.CmdLook,
+        default_cmds.CmdGet,
+        default_cmds.CmdDrop,
+        default_cmds.CmdInventory,
+        default_cmds.CmdExamine,
+        default_cmds.CmdPy,
+    )
 
-    def at_cmdset_creation(self):
-        from evennia import default_cmds
 
-        self.add(default_cmds.CmdHelp())
-        self.add(default_cmds.CmdLook())
-        self.add(default_cmds.CmdGet())
-        self.add(default_cmds.CmdDrop())
-        self.add(default_cmds.CmdInventory())
-        self.add(default_cmds.CmdExamine())
-        self.add(default_cmds.CmdPy())
+_DEMO_SETS = (DemoCommandSetHelp, DemoCommandSetComms, DemoCommandSetRoom)
+
+
+def _swap_demo_cmdset(caller, keep=None):
+    """
+    Remove all demo cmdsets except `keep` from the caller, then add `keep`.
+    Only sets actually on the stack are removed, so a transition normally
+    costs a single cmdset-handler update rather than one per demo set.
+    """
+    stacked = {cset.path for cset in caller.cmdset.get()}
+    for cmdset in _DEMO_SETS:
+        if cmdset is not keep and cmdset.path in stacked:
+            caller.cmdset.remove(cmdset)
+    if keep:
+        caller.cmdset.add(keep)
 
 
 def goto_command_demo_room(caller, raw_string, **kwargs):
     _maintain_demo_room(caller)
-    caller.cmdset.remove(DemoCommandSetHelp)
-    caller.cmdset.remove(DemoCommandSetComms)
-    caller.cmdset.add(DemoCommandSetRoom)
+    _swap_demo_cmdset(caller, DemoCommandSetRoom)
     return "command_demo_room"
 
 
 def goto_cleanup_cmdsets(caller, raw_strings, **kwargs):
-    caller.cmdset.remove(DemoCommandSetHelp)
-    caller.cmdset.remove(DemoCommandSetComms)
-    caller.cmdset.remove(DemoCommandSetRoom)
+    _swap_demo_cmdset(caller)
     return kwargs.get("gotonode")
 
 
@@ -250,12 +309,15 @@ def goto_cleanup_cmdsets(caller, raw_strings, **kwargs):
 # ============================================================
 
 GOTO_CALLABLES = {
-    "send_testing_tagged": send_testing_tagged,
-    "do_nothing": do_nothing,
-    "goto_command_demo_help": goto_command_demo_help,
-    "goto_command_demo_comms": goto_command_demo_comms,
-    "goto_command_demo_room": goto_command_demo_room,
-    "goto_cleanup_cmdsets": goto_cleanup_cmdsets,
+    sys.intern(name): func
+    for name, func in {
+        "send_testing_tagged": send_testing_tagged,
+        "do_nothing": do_nothing,
+        "goto_command_demo_help": goto_command_demo_help,
+        "goto_command_demo_comms": goto_command_demo_comms,
+        "goto_command_demo_room": goto_command_demo_room,
+        "goto_cleanup_cmdsets": goto_cleanup_cmdsets,
+    }.items()
 }
 
 
@@ -445,18 +507,23 @@ back;b: Movement Training -> goto_command_demo_room()
 
 """
 
+# the template is static, so it is parsed once here and only bound per caller
+_MENU_CONTENTS = parse_menu_template_contents(MENU_TEMPLATE, GOTO_CALLABLES)
+
 
 # ============================================================
 # Custom Menu subclass
 # ============================================================
 
+_NAV_KEYS = frozenset(map(sys.intern, ("next", "back", "back to start")))
+_NAV_SUFFIX = " |W|||n |wQ|Wuit|n"
+
+
 class NeoEdenIntroMenu(EvMenu):
     """Customized menu class."""
 
     def close_menu(self):
-        self.caller.cmdset.remove(DemoCommandSetHelp)
-        self.caller.cmdset.remove(DemoCommandSetRoom)
-        self.caller.cmdset.remove(DemoCommandSetComms)
+        _swap_demo_cmdset(self.caller)
         _maintain_demo_room(self.caller, delete=True)
         super().close_menu()
         if self.caller.account:
@@ -464,19 +531,13 @@ class NeoEdenIntroMenu(EvMenu):
             self.caller.account.execute_cmd("unquell")
 
     def options_formatter(self, optionslist):
-        navigation_keys = ("next", "back", "back to start")
-        other, navigation = [], []
-        for key, desc in optionslist:
-            if key in navigation_keys:
-                desc = f" ({desc})" if desc else ""
-                navigation.append(f"|lc{key}|lt|w{key}|n|le{desc}")
-            else:
-                other.append((key, desc))
-        navigation = (
-            (" " + " |W|||n ".join(navigation) + " |W|||n " + "|wQ|Wuit|n")
-            if navigation
-            else ""
-        )
+        navigation = [
+            f"|lc{key}|lt|w{key}|n|le{f' ({desc})' if desc else ''}"
+            for key, desc in optionslist
+            if key in _NAV_KEYS
+        ]
+        other = [(key, desc) for key, desc in optionslist if key not in _NAV_KEYS]
+        navigation = (" " + " |W|||n ".join(navigation) + _NAV_SUFFIX) if navigation else ""
         other = super().options_formatter(other)
         sep = "\n\n" if navigation and other else ""
         return f"{navigation}{sep}{other}"
@@ -484,5 +545,5 @@ class NeoEdenIntroMenu(EvMenu):
 
 def init_menu(caller):
     """Entry point for Neo Eden tutorial menu."""
-    menutree = parse_menu_template(caller, MENU_TEMPLATE, GOTO_CALLABLES)
+    menutree = bind_menu_template(caller, _MENU_CONTENTS)
     NeoEdenIntroMenu(caller, menutree)
@@ -10,6 +10,11 @@ import random
 from evennia import TICKER_HANDLER, CmdSet, Command, logger, search_object
 from . import objects as tut_objects
 
+_rand = random.random
+_choice = random.choice
+
+_ATTACK_VERBS = ("burst", "slice", "slash", "pierce", "blast")
+
 
 # ------------------------------------------------------------
 # Administrative toggle commands
@@ -136,14 +141,28 @@ class Mob(tut_objects.TutorialObject):
     # Ticker / State helpers
     # ---------------------------------------
 
+    def _get_hook(self, hook_key):
+        """Return the bound ticker hook method, cached on ndb."""
+        hooks = self.ndb._hook_cache
+        if hooks is None:
+            hooks = self.ndb._hook_cache = {}
+        hook = hooks.get(hook_key)
+        if hook is None:
+            hook = hooks[hook_key] = getattr(self, hook_key)
+        return hook
+
     def _set_ticker(self, interval, hook_key, stop=False):
         idstring = "neoeden_mob"
         last_interval = self.db.last_ticker_interval
         last_hook_key = self.db.last_hook_key
 
+        if not stop and interval == last_interval and hook_key == last_hook_key:
+            # already ticking this hook at this pace
+            return
+
         if last_interval and last_hook_key:
             TICKER_HANDLER.remove(
-                interval=last_interval, callback=getattr(self, last_hook_key), idstring=idstring
+                interval=last_interval, callback=self._get_hook(last_hook_key), idstring=idstring
             )
 
         self.db.last_ticker_interval = interval
@@ -151,16 +170,40 @@ class Mob(tut_objects.TutorialObject):
 
         if not stop and interval and hook_key:
             TICKER_HANDLER.add(
-                interval=interval, callback=getattr(self, hook_key), idstring=idstring
+                interval=interval, callback=self._get_hook(hook_key), idstring=idstring
             )
 
     def _find_target(self, location):
         """Return first non-superuser Character in room."""
-        targets = [
-            obj for obj in location.contents_get(exclude=self)
-            if obj.has_account and not obj.is_superuser
-        ]
-        return targets[0] if targets else None
+        # reuse the last target found here for as long as it stays put
+        cache = self.ndb._target_cache
+        if cache:
+            cached_location_id, cached_target = cache
+            if (
+                cached_location_id == location.id
+                and cached_target.location == location
+                and cached_target.has_account
+            ):
+                return cached_target
+
+        target = next(
+            (
+                obj
+                for obj in location.contents_get(exclude=self)
+                if obj.has_account and not obj.is_superuser
+            ),
+            None,
+        )
+        self.ndb._target_cache = (location.id, target) if target else None
+        return target
+
+    def _maybe_chatter(self):
+        """Echo an irregular message on ~2% of ticks."""
+        if _rand() < 0.02:
+            # only read the messages on the rare tick that uses them
+            irregular_msgs = self.db.irregular_msgs
+            if irregular_msgs:
+                self.location.msg_contents(_choice(irregular_msgs))
 
     # ---------------------------------------
     # State setters
@@ -168,14 +211,16 @@ class Mob(tut_objects.TutorialObject):
 
     def set_alive(self, *args, **kwargs):
         """Boot online."""
-        self.db.health = self.db.full_health
-        self.db.is_dead = False
-        self.db.desc = self.db.desc_alive
-        self.ndb.is_immortal = self.db.immortal
-        self.ndb.is_patrolling = self.db.patrolling
+        db = self.db
+        patrolling = db.patrolling
+        db.health = db.full_health
+        db.is_dead = False
+        db.desc = db.desc_alive
+        self.ndb.is_immortal = db.immortal
+        self.ndb.is_patrolling = patrolling
         if not self.location:
             self.move_to(self.home)
-        if self.db.patrolling:
+        if patrolling:
             self.start_patrolling()
 
     def set_dead(self):
@@ -193,29 +238,32 @@ class Mob(tut_objects.TutorialObject):
 
     def start_patrolling(self):
         """Begin idle patrol loop."""
-        if not self.db.patrolling:
+        db = self.db
+        if not db.patrolling:
             self.start_idle()
             return
-        self._set_ticker(self.db.patrolling_pace, "do_patrol")
+        self._set_ticker(db.patrolling_pace, "do_patrol")
         self.ndb.is_patrolling = True
         self.ndb.is_hunting = False
         self.ndb.is_attacking = False
-        self.db.health = self.db.full_health
+        db.health = db.full_health
 
     def start_hunting(self):
-        if not self.db.hunting:
+        db = self.db
+        if not db.hunting:
             self.start_patrolling()
             return
-        self._set_ticker(self.db.hunting_pace, "do_hunt")
+        self._set_ticker(db.hunting_pace, "do_hunt")
         self.ndb.is_patrolling = False
         self.ndb.is_hunting = True
         self.ndb.is_attacking = False
 
     def start_attacking(self):
-        if not self.db.aggressive:
+        db = self.db
+        if not db.aggressive:
             self.start_hunting()
             return
-        self._set_ticker(self.db.aggressive_pace, "do_attack")
+        self._set_ticker(db.aggressive_pace, "do_attack")
         self.ndb.is_patrolling = False
         self.ndb.is_hunting = False
         self.ndb.is_attacking = True
@@ -226,8 +274,7 @@ class Mob(tut_objects.TutorialObject):
 
     def do_patrol(self, *args, **kwargs):
         """Patrol state tick."""
-        if random.random() < 0.02 and self.db.irregular_msgs:
-            self.location.msg_contents(random.choice(self.db.irregular_msgs))
+        self._maybe_chatter()
 
         if self.db.aggressive:
             target = self._find_target(self.location)
@@ -237,15 +284,14 @@ class Mob(tut_objects.TutorialObject):
 
         exits = [exi for exi in self.location.exits if exi.access(self, "traverse")]
         if exits:
-            exit = random.choice(exits)
+            exit = _choice(exits)
             self.move_to(exit.destination)
         else:
             self.move_to(self.home)
 
     def do_hunt(self, *args, **kwargs):
         """Pursue visible enemies into adjacent rooms."""
-        if random.random() < 0.02 and self.db.irregular_msgs:
-            self.location.msg_contents(random.choice(self.db.irregular_msgs))
+        self._maybe_chatter()
         if self.db.aggressive:
             target = self._find_target(self.location)
             if target:
@@ -265,8 +311,7 @@ class Mob(tut_objects.TutorialObject):
 
     def do_attack(self, *args, **kwargs):
         """Attack loop."""
-        if random.random() < 0.02 and self.db.irregular_msgs:
-            self.location.msg_contents(random.choice(self.db.irregular_msgs))
+        self._maybe_chatter()
 
         target = self._find_target(self.location)
         if not target:
@@ -274,8 +319,7 @@ class Mob(tut_objects.TutorialObject):
             return
 
         # choose a random combat verb
-        attack_cmd = random.choice(("burst", "slice", "slash", "pierce", "blast"))
-        self.execute_cmd(f"{attack_cmd} {target}")
+        self.execute_cmd(f"{_choice(_ATTACK_VERBS)} {target.key}")
 
         if target.db.health <= 0:
             target.msg(self.db.defeat_msg)
@@ -292,26 +336,35 @@ class Mob(tut_objects.TutorialObject):
 
     def at_hit(self, weapon, attacker, damage):
         """Respond to being hit."""
-        if self.db.health is None:
-            attacker.msg(self.db.weapon_ineffective_msg)
+        db = self.db
+        health = db.health
+        if health is None:
+            attacker.msg(db.weapon_ineffective_msg)
             return
 
         if not self.ndb.is_immortal:
             if not weapon.db.magic:
-                damage /= self.db.damage_resistance
-                attacker.msg(self.db.weapon_ineffective_msg)
+                damage /= db.damage_resistance
+                attacker.msg(db.weapon_ineffective_msg)
             else:
-                self.location.msg_contents(self.db.hit_msg)
-            self.db.health -= damage
+                self.location.msg_contents(db.hit_msg)
+            health -= damage
+            db.health = health
 
-        if self.db.health <= 0:
-            attacker.msg(self.db.death_msg)
+        if health <= 0:
+            attacker.msg(db.death_msg)
             self.set_dead()
         else:
-            if self.db.aggressive and not self.ndb.is_attacking:
+            if db.aggressive and not self.ndb.is_attacking:
                 self.start_attacking()
 
+    def at_post_move(self, source_location, move_type="move", **kwargs):
+        """Forget the cached target when changing rooms."""
+        super().at_post_move(source_location, move_type=move_type, **kwargs)
+        self.ndb._target_cache = None
+
     def at_new_arrival(self, new_character):
         """React immediately to arrivals."""
+        self.ndb._target_cache = None
         if self.db.aggressive and not self.ndb.is_attacking:
             self.start_attacking()
@@ -11,19 +11,28 @@ Drop this into:
 """
 
 import random
+import sys
+import weakref
+
 from django.conf import settings
 from evennia import (
-    TICKER_HANDLER,
     CmdSet,
     Command,
     DefaultRoom,
     DefaultExit,
     default_cmds,
-    search_object,
     syscmdkeys,
     utils,
 )
 
+# module-private generator for the ambient broadcasts
+_RNG = random.Random()
+_choice = _RNG.choice
+
+# lazy-loaded on first use
+_TICKER_HANDLER = None
+_SEARCH_OBJECT = None
+
 # -------------------------------------------------------------
 # Utility
 # -------------------------------------------------------------
@@ -31,6 +40,31 @@ from evennia import (
 _SEARCH_AT_RESULT = utils.object_from_module(settings.SEARCH_AT_RESULT)
 
 
+def _get_ticker_handler():
+    """Import the TICKER_HANDLER on first use."""
+    global _TICKER_HANDLER
+    if _TICKER_HANDLER is None:
+        from evennia.scripts.tickerhandler import TICKER_HANDLER as _TICKER_HANDLER
+    return _TICKER_HANDLER
+
+
+def _get_search_object():
+    """Import search_object on first use."""
+    global _SEARCH_OBJECT
+    if _SEARCH_OBJECT is None:
+        from evennia.utils.search import search_object as _SEARCH_OBJECT
+    return _SEARCH_OBJECT
+
+
+def _detail_key(detailkey):
+    """Lowercase a detail key (skipped if already lowercase) and intern it."""
+    return sys.intern(detailkey if detailkey.islower() else detailkey.lower())
+
+
+# cached ExitHubRoom used by CmdRetreat
+_EXIT_HUB = None
+
+
 # =============================================================
 # Base Commands for Neo Eden
 # =============================================================
@@ -107,24 +141,26 @@ class CmdScanLook(default_cmds.CmdLook):
     def func(self):
         caller = self.caller
         args = self.args
+        location = caller.location
         if args:
             looking_at_obj = caller.search(
                 args,
-                candidates=caller.location.contents + caller.contents,
+                candidates=location.contents + caller.contents,
                 use_nicks=True,
                 quiet=True,
             )
-            if len(looking_at_obj) != 1:
+            if not looking_at_obj:
+                # only fall back to room details when nothing matched
                 detail = self.obj.return_detail(args)
                 if detail:
                     self.caller.msg(detail)
                     return
+            if len(looking_at_obj) != 1:
                 _SEARCH_AT_RESULT(looking_at_obj, caller, args)
                 return
-            else:
-                looking_at_obj = looking_at_obj[0]
+            looking_at_obj = looking_at_obj[0]
         else:
-            looking_at_obj = caller.location
+            looking_at_obj = location
             if not looking_at_obj:
                 caller.msg("You have no location to look at!")
                 return
@@ -151,13 +187,16 @@ class CmdRetreat(default_cmds.MuxCommand):
     help_category = "Neo Eden"
 
     def func(self):
-        from .neoeden_rooms import ExitHubRoom
-        hub = ExitHubRoom.objects.all()
+        global _EXIT_HUB
+        if _EXIT_HUB is None or not _EXIT_HUB.pk:
+            # the hub is a singleton in practice; only query when it's missing
+            _EXIT_HUB = ExitHubRoom.objects.first()
+        hub = _EXIT_HUB
         if not hub:
             self.caller.msg("Signal lost — cannot retreat. Contact an admin.")
             return
         self.caller.msg("|rDisengaging neural uplink...|n")
-        self.caller.move_to(hub[0], move_type="teleport")
+        self.caller.move_to(hub, move_type="teleport")
 
 
 # =============================================================
@@ -171,10 +210,8 @@ class NeoEdenCmdSet(CmdSet):
     priority = 1
 
     def at_cmdset_creation(self):
-        self.add(CmdScan())
-        self.add(CmdHack())
-        self.add(CmdScanLook())
-        self.add(CmdRetreat())
+        # one add() call, so the de-duplication pass runs once per room
+        self.add((CmdScan, CmdHack, CmdScanLook, CmdRetreat))
 
 
 # =============================================================
@@ -195,19 +232,23 @@ class NeoEdenRoom(DefaultRoom):
     def return_detail(self, detailkey):
         details = self.db.details
         if details:
-            return details.get(detailkey.lower(), None)
+            return details.get(_detail_key(detailkey), None)
 
     def set_detail(self, detailkey, description):
-        if self.db.details:
-            self.db.details[detailkey.lower()] = description
+        key = _detail_key(detailkey)
+        details = self.db.details
+        if details is None:
+            self.db.details = {key: description}
         else:
-            self.db.details = {detailkey.lower(): description}
+            # the stored dict saves itself when modified in-place
+            details[key] = description
 
 
 # =============================================================
 # Ambient Weather (Ticker-Based)
 # =============================================================
 
+
 CITY_WEATHER = (
     "A drone swarm buzzes overhead, cameras flickering in the acid rain.",
     "Neon advertisements glitch and stutter, painting the street in pixelated color.",
@@ -217,26 +258,77 @@ CITY_WEATHER = (
     "A siren wails in the distance — another rebellion crushed.",
     "A crackle of thunder arcs between two nearby towers, lighting the smog pink.",
 )
+CITY_WEATHER_FMT = tuple("|w%s|n" % msg for msg in CITY_WEATHER)
+# padded with no-op entries so one draw gives a message 7/28 = 25% of the time
+CITY_WEATHER_WEIGHTED = CITY_WEATHER_FMT + (None,) * 21
 
 
 class CityWeatherRoom(NeoEdenRoom):
     """
     A Neo Eden room with periodic atmospheric updates.
+
+    All weather rooms are driven by one shared ticker (`_tick_weather`)
+    rather than one ticker per room.
     """
 
+    # all weather rooms currently loaded in memory
+    _registry = weakref.WeakSet()
+    # loaded rooms still having their own pre-shared-ticker ticker
+    _legacy = weakref.WeakSet()
+
+    def at_init(self):
+        super().at_init()
+        self._registry.add(self)
+        if self.attributes.has("interval"):
+            # this may run inside TICKER_HANDLER.restore(), so leave the
+            # ticker alone here and retire it from its next tick instead
+            self._legacy.add(self)
+
     def at_object_creation(self):
         super().at_object_creation()
-        self.db.interval = random.randint(50, 70)
-        TICKER_HANDLER.add(
-            interval=self.db.interval, callback=self.update_weather, idstring="neoeden"
-        )
+        self._registry.add(self)
+        _start_weather_ticker()
         self.db.intel = (
             "Environmental node: weather data active. Expect dynamic updates."
         )
 
     def update_weather(self, *args, **kwargs):
-        if random.random() < 0.25:
-            self.msg_contents("|w%s|n" % random.choice(CITY_WEATHER))
+        if self in self._legacy:
+            self._legacy.discard(self)
+            _retire_legacy_ticker(self, self.update_weather)
+            _start_weather_ticker()
+        if not any(obj.has_account for obj in self.contents):
+            # nobody here to see it
+            return
+        msg = _choice(CITY_WEATHER_WEIGHTED)
+        if msg:
+            self.msg_contents(msg)
+
+
+def _tick_weather(*args, **kwargs):
+    """Shared ticker callback updating all loaded weather rooms."""
+    for room in list(CityWeatherRoom._registry):
+        room.update_weather()
+
+
+def _start_weather_ticker():
+    """Register the (persistent) shared weather ticker; re-adding is harmless."""
+    _get_ticker_handler().add(interval=60, callback=_tick_weather, idstring="neoeden_weather")
+
+
+def _retire_legacy_ticker(room, callback):
+    """
+    Remove the per-room "neoeden" ticker that rooms created before the
+    shared tickers were given, along with the interval it was stored under.
+    """
+    try:
+        _get_ticker_handler().remove(
+            interval=room.db.interval, callback=callback, idstring="neoeden"
+        )
+    except KeyError:
+        # already removed
+        pass
+    room.attributes.remove("interval")
 
 
 # =============================================================
@@ -260,8 +352,10 @@ class EntryRoom(NeoEdenRoom):
             character.msg(
                 "|yNeural uplink stabilized. You are now connected to the Neo Eden grid.|n"
             )
-            character.db.hp = 100
-            character.db.credits = 50
+            if character.db.hp is None:
+                # only initialize once; re-entering must not reset progress
+                character.db.hp = 100
+                character.db.credits = 50
 
 
 class ExitHubRoom(NeoEdenRoom):
@@ -278,11 +372,12 @@ class ExitHubRoom(NeoEdenRoom):
 
     def at_object_receive(self, character, source_location, **kwargs):
         if character.has_account:
-            del character.db.hp
-            del character.db.credits
+            character.attributes.remove(["hp", "credits"])
             character.msg("|cAll implants powered down.|n You feel human again.")
-            if character.account:
-                character.account.execute_cmd("unquell")
+            account = character.account
+            if account and account.attributes.has("_quell"):
+                # only run the command if there is anything to unquell
+                account.execute_cmd("unquell")
 
 
 # =============================================================
@@ -295,26 +390,59 @@ GLITCH_FEED = (
     "A whisper: 'They’re watching.'",
     "Your vision overlays static — code signatures too heavy for your firewall.",
 )
+GLITCH_FEED_FMT = tuple("|r%s|n" % msg for msg in GLITCH_FEED)
+# padded with no-op entries so one draw gives a message 12/40 = 30% of the time
+GLITCH_FEED_WEIGHTED = GLITCH_FEED_FMT * 3 + (None,) * 28
 
 
 class GlitchZone(NeoEdenRoom):
     """
     Glitched area with random sensory overload messages.
+
+    All glitch zones are driven by one shared ticker (`_tick_glitch`).
     """
 
+    # all glitch zones currently loaded in memory
+    _registry = weakref.WeakSet()
+    # loaded zones still having their own pre-shared-ticker ticker
+    _legacy = weakref.WeakSet()
+
+    def at_init(self):
+        super().at_init()
+        self._registry.add(self)
+        if self.attributes.has("interval"):
+            # retired from its next tick; see CityWeatherRoom.at_init
+            self._legacy.add(self)
+
     def at_object_creation(self):
         super().at_object_creation()
         self.db.intel = (
             "Warning: Data corruption detected. Proceed at your own risk."
         )
-        self.db.interval = random.randint(40, 60)
-        TICKER_HANDLER.add(
-            interval=self.db.interval, callback=self.corrupt_feed, idstring="neoeden"
-        )
+        self._registry.add(self)
+        _start_glitch_ticker()
 
     def corrupt_feed(self, *args, **kwargs):
-        if random.random() < 0.3:
-            self.msg_contents("|r%s|n" % random.choice(GLITCH_FEED))
+        if self in self._legacy:
+            self._legacy.discard(self)
+            _retire_legacy_ticker(self, self.corrupt_feed)
+            _start_glitch_ticker()
+        if not any(obj.has_account for obj in self.contents):
+            return
+        msg = _choice(GLITCH_FEED_WEIGHTED)
+        if msg:
+            self.msg_contents(msg)
+
+
+def _tick_glitch(*args, **kwargs):
+    """Shared ticker callback corrupting all loaded glitch zones."""
+    for room in list(GlitchZone._registry):
+        room.corrupt_feed()
+
+
+def _start_glitch_ticker():
+    """Register the (persistent) shared glitch ticker; re-adding is harmless."""
+    _get_ticker_handler().add(interval=50, callback=_tick_glitch, idstring="neoeden_glitch")
 
 
 # =============================================================
@@ -334,26 +462,40 @@ class CorpVaultRoom(NeoEdenRoom):
         self.db.failure_teleport_to = "detention_cell"
         self.db.success_teleport_to = "executive_lounge"
 
+    def _get_teleport_destination(self, success):
+        """
+        Find the success/failure destination, memoized on ndb since the
+        targets are fixed at creation.
+        """
+        cachekey = "_success_obj" if success else "_failure_obj"
+        destination = self.nattributes.get(cachekey)
+        if destination is None or not destination.pk:
+            target = self.db.success_teleport_to if success else self.db.failure_teleport_to
+            results = _get_search_object()(target)
+            destination = results[0] if results else None
+            self.nattributes.add(cachekey, destination)
+        return destination
+
     def at_object_receive(self, character, source_location, **kwargs):
         if not character.has_account:
             return
 
-        success = str(character.db.access_code) == str(self.db.access_key)
-        target = (
-            self.db.success_teleport_to if success else self.db.failure_teleport_to
-        )
-        results = search_object(target)
-        if not results:
+        sdb = self.db
+        code = character.db.access_code
+        # no code never gets in, not even when access_key is unset
+        success = code is not None and str(code) == str(sdb.access_key)
+        destination = self._get_teleport_destination(success)
+        if not destination:
             character.msg("Target node not found — contact admin.")
             return
 
         if success:
-            character.msg(f"|g{self.db.success_msg}|n")
+            character.msg(f"|g{sdb.success_msg}|n")
         else:
-            character.msg(f"|r{self.db.failure_msg}|n")
+            character.msg(f"|r{sdb.failure_msg}|n")
 
-        character.move_to(results[0], quiet=True, move_type="teleport")
-        results[0].at_object_receive(character, self)
+        # move_to triggers destination.at_object_receive, also when quiet
+        character.move_to(destination, quiet=True, move_type="teleport")
 
 
 # =============================================================
@@ -2,16 +2,21 @@
 Tests for Neo Eden tutorial replacements.
 """
 
-from mock import patch
+from mock import PropertyMock, patch
 from twisted.internet.base import DelayedCall
 from twisted.trial.unittest import TestCase as TwistedTestCase
 
 from evennia.commands.default.tests import BaseEvenniaCommandTest
 from evennia.utils.create import create_object
-from evennia.utils.test_resources import BaseEvenniaTest, mockdeferLater, mockdelay
+from evennia.utils.test_resources import (
+    BaseEvenniaTest,
+    BaseEvenniaTestCase,
+    mockdeferLater,
+    mockdelay,
+)
 
 # updated imports for your theme
-from . import mob
+from . import intro_menu, mob
 from . import objects as tutobjects
 from . import rooms as tutrooms
 
@@ -27,6 +32,19 @@ class TestNeoEdenMob(BaseEvenniaTest):
         mobobj._set_ticker(0, "foo", stop=True)
 
 
+class TestNeoEdenTutorialObject(BaseEvenniaTestCase):
+    """Needs none of the default accounts/rooms/session, so skips creating them."""
+
+    def test_tutorialobj(self):
+        home = create_object("evennia.objects.objects.DefaultRoom", key="home", nohome=True)
+        elsewhere = create_object(
+            "evennia.objects.objects.DefaultRoom", key="elsewhere", nohome=True
+        )
+        obj1 = create_object(tutobjects.TutorialObject, key="obj", location=elsewhere, home=home)
+        obj1.reset()
+        self.assertEqual(obj1.location, home)
+
+
 DelayedCall.debug = True
 
 
@@ -35,11 +53,6 @@ class TestNeoEdenObjects(TwistedTestCase, BaseEvenniaCommandTest):
         self.char1.delete()
         super(BaseEvenniaCommandTest, self).tearDown()
 
-    def test_tutorialobj(self):
-        obj1 = create_object(tutobjects.TutorialObject, key="obj")
-        obj1.reset()
-        self.assertEqual(obj1.location, obj1.home)
-
     def test_readable(self):
         readable = create_object(tutobjects.TutorialReadable, key="terminal", location=self.room1)
         readable.db.readable_text = "Encrypted data recovered."
@@ -88,3 +101,126 @@ class TestNeoEdenRooms(BaseEvenniaCommandTest):
         room = create_object(tutrooms.TutorialRoom, key="tutorial node")
         self.char1.location = room
         self.call(tutrooms.CmdTutorial(), "", "Sorry, there is no tutorial help available here.")
+
+
+class TestNeoEdenTickerRooms(BaseEvenniaTest):
+    """Rooms created before the shared tickers must drop their own ticker."""
+
+    def _test_legacy_ticker(self, typeclass, hookname, shared_idstring):
+        from evennia.scripts.tickerhandler import TICKER_HANDLER
+
+        def _idstrings():
+            return [store_key[4] for store_key in TICKER_HANDLER.ticker_storage]
+
+        room = create_object(typeclass, key="legacy room")
+        self.addCleanup(TICKER_HANDLER.clear)
+        self.assertIn(shared_idstring, _idstrings())
+        # make it look like a room from before the shared ticker
+        room.db.interval = 55
+        TICKER_HANDLER.add(interval=55, callback=getattr(room, hookname), idstring="neoeden")
+        typeclass._registry.discard(room)
+
+        # at_init may run inside TICKER_HANDLER.restore(), before the store is rebuilt
+        with patch.object(TICKER_HANDLER, "ticker_storage", {}):
+            room.at_init()
+        self.assertIn(room, typeclass._registry)
+        self.assertIn("neoeden", _idstrings())
+
+        # the legacy ticker fires once after restore and retires itself
+        getattr(room, hookname)()
+        self.assertNotIn("neoeden", _idstrings())
+        self.assertIn(shared_idstring, _idstrings())
+        self.assertIsNone(room.db.interval)
+        self.assertNotIn(room, typeclass._legacy)
+        # retiring a ticker that is already gone is harmless
+        room.db.interval = 55
+        typeclass._legacy.add(room)
+        getattr(room, hookname)()
+        self.assertIsNone(room.db.interval)
+
+    def test_weather_room_legacy_ticker(self):
+        self._test_legacy_ticker(tutrooms.CityWeatherRoom, "update_weather", "neoeden_weather")
+
+    def test_glitch_zone_legacy_ticker(self):
+        self._test_legacy_ticker(tutrooms.GlitchZone, "corrupt_feed", "neoeden_glitch")
+
+
+class TestNeoEdenCorpVault(BaseEvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.vault = create_object(tutrooms.CorpVaultRoom, key="vault")
+        self.lounge = create_object("evennia.objects.objects.DefaultRoom", key="executive_lounge")
+        self.cell = create_object("evennia.objects.objects.DefaultRoom", key="detention_cell")
+        patcher = patch.object(
+            type(self.char1), "has_account", new_callable=PropertyMock, return_value=True
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _enter(self, code):
+        if code is None:
+            self.char1.attributes.remove("access_code")
+        else:
+            self.char1.db.access_code = code
+        self.vault.at_object_receive(self.char1, self.room1)
+        return self.char1.location
+
+    def test_success(self):
+        self.assertEqual(self._enter("omega-clearance"), self.lounge)
+
+    def test_failure(self):
+        self.assertEqual(self._enter("alpha-clearance"), self.cell)
+
+    def test_missing_code(self):
+        self.assertEqual(self._enter(None), self.cell)
+        # no code must not match an unset access_key either
+        self.vault.attributes.remove("access_key")
+        self.assertEqual(self._enter(None), self.cell)
+
+    def test_changed_access_key(self):
+        self.assertEqual(self._enter("omega-clearance"), self.lounge)
+        self.vault.db.access_key = 1234
+        self.assertEqual(self._enter("omega-clearance"), self.cell)
+        self.assertEqual(self._enter("1234"), self.lounge)
+        self.assertEqual(self._enter(1234), self.lounge)
+
+
+class TestNeoEdenIntroMenu(BaseEvenniaTest):
+    def _create_demo_room(self):
+        intro_menu._maintain_demo_room(self.char1)
+        # make sure the state is read back from the database, not the cache
+        self.char1.attributes.reset_cache()
+        roomdata = self.char1.db.neoeden_demo_room_data
+        self.assertIsInstance(roomdata, intro_menu._DemoRoomState)
+        self.assertEqual(roomdata.prev_loc, self.room1)
+        self.assertEqual(self.char1.location, roomdata.pod)
+        created = roomdata.created_objects()
+        self.assertEqual(len(created), 6)
+        for obj in created:
+            self.assertTrue(obj.pk)
+        return roomdata, created
+
+    def _assert_deleted(self, created):
+        self.assertEqual(self.char1.location, self.room1)
+        self.assertFalse(any(obj.pk for obj in created))
+        self.assertFalse(self.char1.attributes.has("neoeden_demo_room_data"))
+
+    def test_maintain_demo_room(self):
+        _, created = self._create_demo_room()
+        intro_menu._maintain_demo_room(self.char1, delete=True)
+        self._assert_deleted(created)
+
+    def test_maintain_demo_room_legacy_tuple(self):
+        roomdata, created = self._create_demo_room()
+        # stored by an older version of the module
+        self.char1.db.neoeden_demo_room_data = (
+            roomdata.prev_loc,
+            roomdata.pod,
+            roomdata.sign,
+            roomdata.street,
+            roomdata.pad,
+            roomdata.door_out,
+            roomdata.door_in,
+        )
+        intro_menu._maintain_demo_room(self.char1, delete=True)
+        self._assert_deleted(created)
@@ -180,6 +180,14 @@ in one step with:
 
 ```
 
+If the same template is used by many callers, parse it only once with
+`parse_menu_template_contents` and hand the result to each caller with
+`bind_menu_template`:
+::
+
+    contents = evmenu.parse_menu_template_contents(menu_template, goto_callables)
+    menutree = evmenu.bind_menu_template(caller, contents)
+
 The `goto_callables` is a mapping `{"funcname": callable, ...}`, where each
 callable must be a module-global function on the form
 `funcname(caller, raw_string, **kwargs)` (like any goto-callable). The
@@ -1942,19 +1950,20 @@ def _generated_node(caller, raw_string, **kwargs):
     return text, options
 
 
-def parse_menu_template(caller, menu_template, goto_callables=None):
+def parse_menu_template_contents(menu_template, goto_callables=None):
     """
-    Parse menu-template string. The main function of the EvMenu templating system.
+    Parse menu-template string into its node contents, without binding it to
+    any caller. Since the result only depends on the template, it can be parsed
+    once and then handed to any number of callers with `bind_menu_template`.
 
     Args:
-        caller (Object or Account): Entity using the menu.
         menu_template (str): Menu described using the templating format.
         goto_callables (dict, optional): Mapping between call-names and callables
             on the form `callable(caller, raw_string, **kwargs)`. These are what is
             available to use in the `menu_template` string.
 
     Returns:
-        dict: A `{"node": nodefunc}` menutree suitable to pass into EvMenu.
+        dict: A `{"nodename": (text, options)}` mapping of the parsed nodes.
 
     """
 
@@ -2061,28 +2070,58 @@ def parse_menu_template(caller, menu_template, goto_callables=None):
 
         return options
 
-    def _parse(caller, menu_template, goto_callables):
+    def _parse(menu_template, goto_callables):
         """
-        Parse the menu string format into a node tree.
+        Parse the menu string format into a node content map.
 
         """
-        nodetree = {}
         splits = _RE_NODE.split(menu_template)
         splits = splits[1:] if splits else []
 
-        # from evennia import set_trace;set_trace(term_size=(140,120))
         content_map = {}
         for node_ind in range(0, len(splits), 2):
             nodename, nodetxt = splits[node_ind], splits[node_ind + 1]
             text, *optiontxt = _RE_OPTIONS_SEP.split(nodetxt, maxsplit=2)
             options = _parse_options(nodename, optiontxt, goto_callables)
             content_map[nodename] = (text, options)
-            nodetree[nodename] = _generated_node
-        caller.db._evmenu_template_contents = content_map
 
-        return nodetree
+        return content_map
+
+    return _parse(menu_template, goto_callables)
+
 
-    return _parse(caller, menu_template, goto_callables)
+def bind_menu_template(caller, template_contents):
+    """
+    Make pre-parsed menu-template contents available to a caller.
+
+    Args:
+        caller (Object or Account): Entity using the menu.
+        template_contents (dict): The output of `parse_menu_template_contents`.
+
+    Returns:
+        dict: A `{"node": nodefunc}` menutree suitable to pass into EvMenu.
+
+    """
+    caller.db._evmenu_template_contents = template_contents
+    return {nodename: _generated_node for nodename in template_contents}
+
+
+def parse_menu_template(caller, menu_template, goto_callables=None):
+    """
+    Parse menu-template string. The main function of the EvMenu templating system.
+
+    Args:
+        caller (Object or Account): Entity using the menu.
+        menu_template (str): Menu described using the templating format.
+        goto_callables (dict, optional): Mapping between call-names and callables
+            on the form `callable(caller, raw_string, **kwargs)`. These are what is
+            available to use in the `menu_template` string.
+
+    Returns:
+        dict: A `{"node": nodefunc}` menutree suitable to pass into EvMenu.
+
+    """
+    return bind_menu_template(caller, parse_menu_template_contents(menu_template, goto_callables))
 
 
 def template2menu(
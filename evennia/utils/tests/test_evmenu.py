@@ -323,6 +323,15 @@ class TestMenuTemplateParse(BaseEvenniaTest):
         menutree = evmenu.parse_menu_template(self.char1, self.menu_template, self.goto_callables)
         self.assertEqual(menutree, {"start": Anything, "node1": Anything, "node2": Anything})
 
+    def test_bind_menu_template(self):
+        """Pre-parsed template contents can be reused across callers"""
+
+        contents = evmenu.parse_menu_template_contents(self.menu_template, self.goto_callables)
+        self.assertEqual(set(contents), {"start", "node1", "node2"})
+        menutree = evmenu.bind_menu_template(self.char1, contents)
+        self.assertEqual(menutree, {"start": Anything, "node1": Anything, "node2": Anything})
+        self.assertEqual(set(self.char1.db._evmenu_template_contents), {"start", "node1", "node2"})
+
     def test_template2menu(self):
         evmenu.template2menu(self.char1, self.menu_template, self.goto_callables)
 